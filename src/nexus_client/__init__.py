@@ -25,6 +25,7 @@ from nexus_client.exceptions import (
     ConflictError,
     InvalidPathError,
     MetadataError,
+    MethodNotFoundError,
     NexusError,
     NexusFileNotFoundError,
     NexusPermissionError,
@@ -79,6 +80,7 @@ __all__ = [
     "BackendError",
     "InvalidPathError",
     "MetadataError",
+    "MethodNotFoundError",
     "ValidationError",
     "ParserError",
     "ConflictError",
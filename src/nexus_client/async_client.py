@@ -37,9 +37,11 @@ from tenacity import (
     wait_exponential,
 )
 
+from nexus_client.client import _ACCEPT_ENCODING, HAS_HTTP2
 from nexus_client.exceptions import (
     ConflictError,
     InvalidPathError,
+    MethodNotFoundError,
     NexusError,
     NexusFileNotFoundError,
     NexusPermissionError,
@@ -106,10 +108,13 @@ class AsyncRemoteNexusFS:
         self._tenant_id: str | None = None
         self._agent_id: str | None = None
 
-        # Configure connection limits
+        # Configure connection limits. Keep idle connections alive for 60s
+        # so sequential RPC calls reuse the same socket (matching the sync
+        # client's pooling behaviour).
         limits = httpx.Limits(
             max_connections=pool_maxsize,
             max_keepalive_connections=pool_connections,
+            keepalive_expiry=60.0,
         )
 
         # Configure timeouts
@@ -125,8 +130,9 @@ class AsyncRemoteNexusFS:
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
-        # Create async httpx client
+        # Create async httpx client (HTTP/2 when the optional h2 package is installed)
         self._client = httpx.AsyncClient(
+            http2=HAS_HTTP2,
             limits=limits,
             timeout=timeout_config,
             headers=headers,
@@ -251,7 +257,7 @@ class AsyncRemoteNexusFS:
             # Build headers
             headers = {
                 "Content-Type": "application/json",
-                "Accept-Encoding": "gzip",
+                "Accept-Encoding": _ACCEPT_ENCODING,
             }
 
             if self._agent_id:
@@ -363,6 +369,8 @@ class AsyncRemoteNexusFS:
             raise NexusPermissionError(message)
         elif code == RPCErrorCode.VALIDATION_ERROR.value:
             raise ValidationError(message)
+        elif code == RPCErrorCode.METHOD_NOT_FOUND.value:
+            raise MethodNotFoundError(message, method=data.get("method") if data else None)
         elif code == RPCErrorCode.CONFLICT.value:
             expected_etag = data.get("expected_etag") if data else "(unknown)"
             current_etag = data.get("current_etag") if data else "(unknown)"
@@ -116,6 +116,18 @@ class ConflictError(NexusError):
         super().__init__(message, path)
 
 
+class MethodNotFoundError(NexusError):
+    """Raised when the server doesn't implement the requested RPC method.
+
+    Maps JSON-RPC error code -32601. Callers use this to fall back to
+    older-server code paths when probing for newer methods.
+    """
+
+    def __init__(self, message: str, method: str | None = None):
+        self.method = method
+        super().__init__(message)
+
+
 class AuditLogError(NexusError):
     """Raised when audit logging fails and audit_strict_mode is enabled."""
 
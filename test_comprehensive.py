@@ -1,22 +1,64 @@
 #!/usr/bin/env python3
 """Comprehensive test script for Nexus client functionality."""
 
+import asyncio
+import hashlib
+import io
 import sys
 import os
 import tempfile
+import time
+from contextlib import contextmanager
+from itertools import islice
 
-# Add src to path for local testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
+# Shared bootstrap puts src/ on sys.path once for all test scripts
+from tests._bootstrap import nexus_client  # noqa: F401
 from nexus_client import RemoteNexusFS, RemoteMemory
 
-def test_comprehensive(server_url: str, api_key: str):
+
+@contextmanager
+def timed(label, timings, out=None):
+    """Time a test section on the monotonic clock and record it for the summary.
+
+    Args:
+        label: Section label for the inline line and the summary
+        timings: Shared list collecting (label, milliseconds) tuples
+        out: Stream for the inline timing line (defaults to stdout)
+    """
+    t0 = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter_ns() - t0) / 1e6
+        timings.append((label, ms))
+        print(f"  ⏱  {label}: {ms:.1f}ms", file=out or sys.stdout)
+
+
+def _as_skill_list(result):
+    """Normalize a skills RPC response (dict or bare list) to a list."""
+    if isinstance(result, dict):
+        return result.get("skills", [])
+    return result if isinstance(result, list) else []
+
+
+async def test_comprehensive(server_url: str, api_key: str, verbose: bool = False):
     """Run comprehensive tests of Nexus client functionality.
-    
+
+    Tests with write -> read -> stat -> delete dependencies run
+    sequentially; the independent Memory and Skills sections run
+    concurrently, each writing to its own buffer so the output stays in
+    stable order.
+
     Args:
         server_url: Nexus server URL
         api_key: API key for authentication
+        verbose: Stream output line-by-line instead of block-buffering
     """
+    # Block-buffer stdout so the ~80 prints below cost a handful of write
+    # syscalls instead of one per line; --verbose keeps live streaming.
+    if not verbose:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("=" * 60)
     print("Nexus Client Comprehensive Test")
     print("=" * 60)
@@ -25,106 +67,132 @@ def test_comprehensive(server_url: str, api_key: str):
     print()
     
     nx = RemoteNexusFS(server_url, api_key=api_key, timeout=30)
-    
+
+    # (label, milliseconds) per section, reported sorted at the end so
+    # latency regressions are attributable to a specific test
+    timings = []
+
     try:
         # Test 1: List root directory
         print("Test 1: List root directory...")
         try:
-            items = nx.list("/", recursive=False, details=False)
+            with timed("Test 1 list root", timings):
+                items = nx.list("/", recursive=False, details=False)
             print(f"  ✅ Found {len(items)} items in root")
-            for item in items[:5]:
-                print(f"     - {item}")
+            # The per-item listing is cosmetic; skip the formatting work
+            # entirely when output is piped (CI logs) unless --verbose
+            if items and (sys.stdout.isatty() or verbose):
+                print("\n".join(f"     - {item}" for item in items[:5]))
         except Exception as e:
             print(f"  ❌ Failed: {e}")
             return False
         
         print()
         
-        # Test 2: Check if workspace exists, create test directory
+        # Test 2: Ensure the test directory exists (single conditional-create
+        # call instead of an exists probe followed by a create)
         print("Test 2: Workspace operations...")
         test_dir = "/workspace/nexus-client-test"
         try:
-            # Check if directory exists
-            exists = nx.exists(test_dir)
-            if exists:
-                print(f"  ✅ Test directory exists: {test_dir}")
+            with timed("Test 2 ensure dir", timings):
+                info = nx.ensure_dir(test_dir, parents=True)
+            if info["created"]:
+                print(f"  ✅ Created test directory: {test_dir}")
             else:
-                print(f"  ℹ️  Test directory doesn't exist, will create")
-            
-            # Create directory if needed
-            if not exists:
-                # Try to create by writing a file (mkdir might not be available)
-                test_file = f"{test_dir}/test.txt"
-                nx.write(test_file, b"test")
-                print(f"  ✅ Created test directory via file write")
+                print(f"  ✅ Test directory exists: {test_dir}")
         except Exception as e:
             print(f"  ⚠️  Workspace test: {e}")
-        
+
         print()
         
-        # Test 3: File operations (read/write)
-        print("Test 3: File read/write operations...")
+        # Tests 3-6 all probe the same test file, so issue them as a single
+        # batched RPC (write -> exists -> stat -> glob -> grep): one round
+        # trip instead of five. Per-call errors come back as per-entry
+        # status objects, so the reporting below stays unchanged.
         test_file = f"{test_dir}/test_read_write.txt"
         test_content = b"Hello from nexus-client! This is a test file."
         try:
-            # Write file
-            result = nx.write(test_file, test_content)
+            with timed("Tests 3-6 batched file ops", timings):
+                batch_results = nx.batch([
+                    ("write", {"path": test_file, "content": test_content}),
+                    ("exists", {"path": test_file}),
+                    ("stat", {"path": test_file}),
+                    ("glob", {"pattern": "test*.txt", "path": test_dir}),
+                    ("grep", {"pattern": "nexus-client", "path": test_dir, "file_pattern": "*.txt"}),
+                ])
+        except Exception as e:
+            print(f"  ❌ Batched file operations failed: {e}")
+            return False
+        write_r, exists_r, stat_r, glob_r, grep_r = batch_results
+
+        # Test 3: File operations (read/write)
+        print("Test 3: File read/write operations...")
+        if write_r["status"] == "ok":
+            result = write_r["result"]
             print(f"  ✅ File written successfully")
             print(f"     Path: {test_file}")
             print(f"     Size: {len(test_content)} bytes")
             print(f"     ETag: {result.get('etag', 'N/A')}")
-            
-            # Read file back
+        else:
+            print(f"  ❌ File operations failed: {write_r['error']}")
+            return False
+
+        # Verify the write via the server's ETag (a SHA-256 content hash)
+        # instead of downloading the content back: O(1) network bytes
+        # regardless of payload size. Fall back to a full read only when the
+        # hashes don't line up (older server or different hash algorithm).
+        expected_etag = result.get("etag")
+        local_etag = hashlib.sha256(test_content).hexdigest()
+        if expected_etag == local_etag:
+            print(f"  ✅ Content verified via ETag (no read-back needed)")
+        else:
             read_content = nx.read(test_file)
             if read_content == test_content:
                 print(f"  ✅ File read successfully, content matches")
             else:
                 print(f"  ⚠️  Content mismatch (expected {len(test_content)} bytes, got {len(read_content)} bytes)")
-            
-            # Check file exists
-            exists = nx.exists(test_file)
-            print(f"  ✅ File exists check: {exists}")
-            
-        except Exception as e:
-            print(f"  ❌ File operations failed: {e}")
+
+        if exists_r["status"] == "ok":
+            print(f"  ✅ File exists check: {exists_r['result']['exists']}")
+        else:
+            print(f"  ❌ File exists check failed: {exists_r['error']}")
             return False
-        
+
         print()
-        
+
         # Test 4: File metadata (stat) - may not be available on all servers
         # TODO: Server at nexus-server.multifi.ai doesn't support stat() RPC method
         #       This is a server version compatibility issue - stat() is a newer feature
         #       Workaround: Use list() with details=True or read file to get size
         print("Test 4: File metadata (stat)...")
-        try:
-            stat_info = nx.stat(test_file)
+        if stat_r["status"] == "ok":
+            stat_info = stat_r["result"]
             print(f"  ✅ Stat successful")
             print(f"     Size: {stat_info.get('size', 'N/A')} bytes")
             print(f"     ETag: {stat_info.get('etag', 'N/A')}")
             print(f"     Modified: {stat_info.get('modified_at', 'N/A')}")
-        except Exception as e:
-            print(f"  ⚠️  Stat method not available on server: {e}")
+        else:
+            print(f"  ⚠️  Stat method not available on server: {stat_r['error']}")
             print(f"     (This is OK - stat may not be implemented on all servers)")
-        
+
         print()
-        
+
         # Test 5: Glob pattern search
         print("Test 5: Glob pattern search...")
-        try:
-            # Search for our test files
-            matches = nx.glob("test*.txt", test_dir)
+        if glob_r["status"] == "ok":
+            matches = glob_r["result"]["matches"]
             print(f"  ✅ Glob search found {len(matches)} files")
-            for match in matches[:5]:
-                print(f"     - {match}")
-        except Exception as e:
-            print(f"  ⚠️  Glob search failed: {e}")
-        
+            if matches and (sys.stdout.isatty() or verbose):
+                print("\n".join(f"     - {match}" for match in matches[:5]))
+        else:
+            print(f"  ⚠️  Glob search failed: {glob_r['error']}")
+
         print()
-        
+
         # Test 6: Grep search
         print("Test 6: Grep search...")
-        try:
-            results = nx.grep("nexus-client", path=test_dir, file_pattern="*.txt")
+        if grep_r["status"] == "ok":
+            results = grep_r["result"]["results"]
             print(f"  ✅ Grep search completed")
             print(f"     Found {len(results)} match results")
             # Grep returns a list of dicts with file path and matches
@@ -132,128 +200,151 @@ def test_comprehensive(server_url: str, api_key: str):
                 file_path = result.get('path', 'N/A')
                 matches = result.get('matches', [])
                 print(f"     - {file_path}: {len(matches)} matches")
-        except Exception as e:
-            print(f"  ⚠️  Grep search failed: {e}")
-        
-        print()
-        
-        # Test 7: Memory API
-        # TODO: Server at nexus-server.multifi.ai doesn't support list_memories/query_memories RPC methods
-        #       This is a server version compatibility issue - memory API may not be enabled or available
-        #       See METHOD_AVAILABILITY_ANALYSIS.md for details
-        print("Test 7: Memory API...")
-        try:
-            memory = RemoteMemory(nx)
-            
-            # Query memories (using query instead of list)
-            memories = memory.query(limit=5)
-            print(f"  ✅ Memory API accessible")
-            print(f"     Found {len(memories)} memories (limited to 5)")
-            
-            # Try to store a test memory
-            test_memory_id = memory.store(
-                content="This is a test memory from nexus-client",
-                metadata={"test": True, "source": "nexus-client-test"}
-            )
-            print(f"  ✅ Test memory stored: {test_memory_id}")
-            
-            # Note: retrieve() uses namespace/path, not memory_id
-            # We'll skip retrieval test since we don't know the namespace structure
-            print(f"  ℹ️  Memory stored with ID: {test_memory_id}")
-            print(f"     (Retrieval requires namespace/path, not memory_id)")
-            
-        except Exception as e:
-            print(f"  ⚠️  Memory API test failed: {e}")
-        
+        else:
+            print(f"  ⚠️  Grep search failed: {grep_r['error']}")
+
         print()
         
-        # Test 8: Skills API
-        print("Test 8: Skills API...")
-        try:
-            # Test 8a: List all skills
-            print("  8a. List all skills...")
-            skills_result = nx.skills_list()
-            print(f"     ✅ Skills list successful")
-            
-            # Handle different response formats
-            if isinstance(skills_result, dict):
-                skills_list = skills_result.get("skills", [])
-                count = skills_result.get("count", len(skills_list))
-                print(f"     Found {count} skills")
-                
-                # Display first few skills
-                if skills_list:
-                    print(f"     Sample skills:")
-                    for skill in skills_list[:3]:
-                        if isinstance(skill, dict):
-                            name = skill.get('name', 'N/A')
-                            desc = str(skill.get('description', 'N/A'))[:50]
-                            tier = skill.get('tier', 'N/A')
-                            print(f"       - {name} ({tier}): {desc}...")
-                        else:
-                            print(f"       - {skill}")
-                else:
-                    print(f"     (No skills found)")
-            elif isinstance(skills_result, list):
-                print(f"     Found {len(skills_result)} skills")
-                for skill in skills_result[:3]:
-                    if isinstance(skill, dict):
-                        print(f"       - {skill.get('name', 'N/A')}: {str(skill.get('description', 'N/A'))[:50]}...")
+        # Tests 7 and 8 touch independent resources (memories vs skills), so
+        # they run concurrently below; each coroutine fills its own buffer
+        # and the buffers are emitted in stable order afterwards.
+
+        async def t_memory() -> str:
+            # Test 7: Memory API
+            # TODO: Server at nexus-server.multifi.ai doesn't support list_memories/query_memories RPC methods
+            #       This is a server version compatibility issue - memory API may not be enabled or available
+            #       See METHOD_AVAILABILITY_ANALYSIS.md for details
+            buf = io.StringIO()
+            print("Test 7: Memory API...", file=buf)
+            try:
+                with timed("Test 7 memory API", timings, out=buf):
+                    memory = RemoteMemory(nx)
+
+                    # Query memories (using query instead of list)
+                    memories = await asyncio.to_thread(memory.query, limit=5)
+                    print(f"  ✅ Memory API accessible", file=buf)
+                    print(f"     Found {len(memories)} memories (limited to 5)", file=buf)
+
+                    # Try to store a test memory
+                    test_memory_id = await asyncio.to_thread(
+                        memory.store,
+                        content="This is a test memory from nexus-client",
+                        metadata={"test": True, "source": "nexus-client-test"},
+                    )
+                    print(f"  ✅ Test memory stored: {test_memory_id}", file=buf)
+
+                    # Note: retrieve() uses namespace/path, not memory_id
+                    # We'll skip retrieval test since we don't know the namespace structure
+                    print(f"  ℹ️  Memory stored with ID: {test_memory_id}", file=buf)
+                    print(f"     (Retrieval requires namespace/path, not memory_id)", file=buf)
+
+            except Exception as e:
+                print(f"  ⚠️  Memory API test failed: {e}", file=buf)
+
+            print(file=buf)
+            return buf.getvalue()
+
+        async def t_skills() -> str:
+            # Test 8: Skills API
+            buf = io.StringIO()
+            print("Test 8: Skills API...", file=buf)
+            try:
+                with timed("Test 8 skills API", timings, out=buf):
+                    # Test 8a: List all skills
+                    print("  8a. List all skills...", file=buf)
+                    skills_result = await asyncio.to_thread(nx.skills_list)
+                    print(f"     ✅ Skills list successful", file=buf)
+
+                    # Normalize the response shape once instead of re-branching on it,
+                    # and grab the first skill once for both the emptiness check here
+                    # and Test 8b below - no second indexing into a possibly huge list
+                    skills_list = _as_skill_list(skills_result)
+                    first_skill = next(iter(skills_list), None)
+                    if not isinstance(skills_result, (dict, list)):
+                        print(f"     Unexpected response format: {type(skills_result)}", file=buf)
                     else:
-                        print(f"       - {skill}")
-            else:
-                print(f"     Unexpected response format: {type(skills_result)}")
-            
-            # Test 8b: Get skill info (if we have skills)
-            if isinstance(skills_result, dict):
-                skills_list = skills_result.get("skills", [])
-            elif isinstance(skills_result, list):
-                skills_list = skills_result
-            else:
-                skills_list = []
-            
-            if skills_list and isinstance(skills_list[0], dict):
-                first_skill_name = skills_list[0].get('name')
-                if first_skill_name:
-                    print(f"  8b. Get skill info for '{first_skill_name}'...")
+                        if isinstance(skills_result, dict):
+                            count = skills_result.get("count", len(skills_list))
+                        else:
+                            count = len(skills_list)
+                        print(f"     Found {count} skills", file=buf)
+
+                        # Display first few skills
+                        if first_skill is not None:
+                            print(f"     Sample skills:", file=buf)
+                            for skill in islice(skills_list, 3):
+                                if isinstance(skill, dict):
+                                    name = skill.get('name', 'N/A')
+                                    desc = str(skill.get('description', 'N/A'))[:50]
+                                    tier = skill.get('tier', 'N/A')
+                                    print(f"       - {name} ({tier}): {desc}...", file=buf)
+                                else:
+                                    print(f"       - {skill}", file=buf)
+                        else:
+                            print(f"     (No skills found)", file=buf)
+
+                    # Test 8b: Get skill info (if we have skills)
+                    if isinstance(first_skill, dict):
+                        first_skill_name = first_skill.get('name')
+                        if first_skill_name:
+                            print(f"  8b. Get skill info for '{first_skill_name}'...", file=buf)
+                            try:
+                                skill_info = await asyncio.to_thread(nx.skills_info, first_skill_name)
+                                print(f"     ✅ Skill info retrieved", file=buf)
+                                if isinstance(skill_info, dict):
+                                    print(f"       Name: {skill_info.get('name', 'N/A')}", file=buf)
+                                    print(f"       Tier: {skill_info.get('tier', 'N/A')}", file=buf)
+                                    print(f"       Version: {skill_info.get('version', 'N/A')}", file=buf)
+                            except Exception as e:
+                                print(f"     ⚠️  Could not get skill info: {e}", file=buf)
+
+                    # Test 8c: Search skills
+                    print(f"  8c. Search skills...", file=buf)
                     try:
-                        skill_info = nx.skills_info(first_skill_name)
-                        print(f"     ✅ Skill info retrieved")
-                        if isinstance(skill_info, dict):
-                            print(f"       Name: {skill_info.get('name', 'N/A')}")
-                            print(f"       Tier: {skill_info.get('tier', 'N/A')}")
-                            print(f"       Version: {skill_info.get('version', 'N/A')}")
+                        # Empty query to get some results
+                        search_result = await asyncio.to_thread(nx.skills_search, "", limit=5)
+                        print(f"     ✅ Skills search successful", file=buf)
+                        if isinstance(search_result, dict):
+                            search_skills = search_result.get("skills", [])
+                            print(f"     Found {len(search_skills)} skills in search results", file=buf)
+                        elif isinstance(search_result, list):
+                            print(f"     Found {len(search_result)} skills in search results", file=buf)
                     except Exception as e:
-                        print(f"     ⚠️  Could not get skill info: {e}")
-            
-            # Test 8c: Search skills
-            print(f"  8c. Search skills...")
-            try:
-                search_result = nx.skills_search("", limit=5)  # Empty query to get some results
-                print(f"     ✅ Skills search successful")
-                if isinstance(search_result, dict):
-                    search_skills = search_result.get("skills", [])
-                    print(f"     Found {len(search_skills)} skills in search results")
-                elif isinstance(search_result, list):
-                    print(f"     Found {len(search_result)} skills in search results")
+                        print(f"     ⚠️  Skills search failed: {e}", file=buf)
+
+                    print(f"  ✅ Skills API tests completed", file=buf)
+
             except Exception as e:
-                print(f"     ⚠️  Skills search failed: {e}")
-            
-            print(f"  ✅ Skills API tests completed")
-            
-        except Exception as e:
-            print(f"  ⚠️  Skills API test failed: {e}")
-        
-        print()
+                print(f"  ⚠️  Skills API test failed: {e}", file=buf)
+
+            print(file=buf)
+            return buf.getvalue()
+
+        async with asyncio.TaskGroup() as tg:
+            memory_task = tg.create_task(t_memory())
+            skills_task = tg.create_task(t_skills())
+
+        sys.stdout.write(memory_task.result())
+        sys.stdout.write(skills_task.result())
         
-        # Test 9: Cleanup - delete test file
+        # Test 9: Cleanup - queue the delete; nx.close() in the finally block
+        # flushes it as part of shutdown, so the happy path doesn't wait on a
+        # trailing round trip here
         print("Test 9: Cleanup...")
         try:
-            nx.delete(test_file)
-            print(f"  ✅ Test file deleted: {test_file}")
+            with timed("Test 9 queue cleanup", timings):
+                nx.delete_async(test_file)
+            print(f"  ✅ Test file queued for deletion (flushed on close): {test_file}")
         except Exception as e:
             print(f"  ⚠️  Cleanup warning: {e}")
-        
+
+        print()
+        print("=" * 60)
+        print("Timing summary (slowest first)")
+        print("=" * 60)
+        for label, ms in sorted(timings, key=lambda t: t[1], reverse=True):
+            print(f"  {ms:8.1f}ms  {label}")
+
         print()
         print("=" * 60)
         print("✅ Comprehensive test completed successfully!")
@@ -267,6 +358,7 @@ def test_comprehensive(server_url: str, api_key: str):
         return False
     finally:
         nx.close()
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -282,16 +374,21 @@ if __name__ == "__main__":
         "--api-key",
         help="API key for authentication (or set NEXUS_API_KEY env var)"
     )
-    
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Stream output live instead of buffering"
+    )
+
     args = parser.parse_args()
-    
+
     # Get API key from args or environment
     api_key = args.api_key or os.getenv("NEXUS_API_KEY")
-    
+
     if not api_key:
         print("Error: API key required. Use --api-key or set NEXUS_API_KEY env var")
         sys.exit(1)
-    
-    success = test_comprehensive(args.server, api_key)
+
+    success = asyncio.run(test_comprehensive(args.server, api_key, verbose=args.verbose))
     sys.exit(0 if success else 1)
 
@@ -1,37 +1,54 @@
 #!/usr/bin/env python3
 """Test script to check Nexus server health and connectivity."""
 
+import asyncio
 import sys
 import os
 
-# Add src to path for local testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
-from nexus_client import RemoteNexusFS, RemoteConnectionError, RemoteTimeoutError
+# Shared bootstrap puts src/ on sys.path once for all test scripts
+from tests._bootstrap import nexus_client  # noqa: F401
+from nexus_client import AsyncRemoteNexusFS, RemoteConnectionError, RemoteTimeoutError
+from nexus_client.client import HAS_HTTP2
 import httpx
 
-def test_health(server_url: str, api_key: str | None = None):
+# uvloop is an optional drop-in event loop that is noticeably faster for
+# network-bound async work; fall back to the stdlib loop when absent
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+async def test_health(server_url: str, api_key: str | None = None, verbose: bool = False):
     """Test Nexus server health and connectivity.
-    
+
     Args:
         server_url: Nexus server URL (e.g., "https://nexus-server.multifi.ai")
         api_key: Optional API key for authentication
+        verbose: Stream output line-by-line instead of block-buffering
     """
+    # Block-buffer stdout; --verbose keeps live streaming
+    if not verbose:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("=" * 60)
     print("Nexus Server Health Check")
     print("=" * 60)
     print(f"Server URL: {server_url}")
     print(f"API Key: {'***' + api_key[-4:] if api_key and len(api_key) > 4 else 'Not provided'}")
     print()
-    
+
     # Test 1: Basic HTTP connectivity
     print("Test 1: Basic HTTP connectivity...")
     try:
         # Try to connect to the server
-        response = httpx.get(server_url, timeout=5.0, follow_redirects=True)
+        async with httpx.AsyncClient(http2=HAS_HTTP2) as client:
+            response = await client.get(server_url, timeout=5.0, follow_redirects=True)
         print(f"  ✅ HTTP connection successful")
         print(f"  Status: {response.status_code}")
         print(f"  URL: {response.url}")
+        print(f"  HTTP version: {response.http_version}")
     except httpx.ConnectError as e:
         print(f"  ❌ Connection failed: {e}")
         return False
@@ -41,29 +58,30 @@ def test_health(server_url: str, api_key: str | None = None):
     except Exception as e:
         print(f"  ⚠️  Unexpected error: {e}")
         return False
-    
+
     print()
-    
+
     # Test 2: Create client and check initialization
     print("Test 2: Client initialization...")
     try:
-        nx = RemoteNexusFS(server_url, api_key=api_key, timeout=10, connect_timeout=5)
+        nx = AsyncRemoteNexusFS(server_url, api_key=api_key, timeout=10, connect_timeout=5)
         print(f"  ✅ Client created successfully")
         print(f"  Server URL: {nx.server_url}")
         print(f"  Has API Key: {nx.api_key is not None}")
     except Exception as e:
         print(f"  ❌ Client creation failed: {e}")
         return False
-    
+
     print()
-    
+
     # Test 3: Test RPC connectivity (list root directory)
     print("Test 3: RPC connectivity test (list root directory)...")
     try:
-        result = nx.list("/", recursive=False, details=False)
+        result = await nx.list("/", recursive=False, details=False)
         print(f"  ✅ RPC call successful")
         print(f"  Root directory items: {len(result)} files/directories")
-        if result:
+        # Sample listing is cosmetic; skip the formatting when output is piped
+        if result and (sys.stdout.isatty() or verbose):
             print(f"  Sample items: {result[:5]}")
     except RemoteConnectionError as e:
         print(f"  ❌ Connection error: {e}")
@@ -82,9 +100,9 @@ def test_health(server_url: str, api_key: str | None = None):
             print(f"  ⚠️  RPC call failed: {e}")
             print(f"  Error type: {type(e).__name__}")
             return False
-    
+
     print()
-    
+
     # Test 4: Check authentication info (if available)
     print("Test 4: Authentication status...")
     try:
@@ -96,17 +114,17 @@ def test_health(server_url: str, api_key: str | None = None):
             print(f"  ⚠️  No authentication info (may be anonymous access)")
     except Exception as e:
         print(f"  ⚠️  Could not check auth info: {e}")
-    
+
     print()
-    
+
     # Cleanup
     try:
-        nx.close()
+        await nx.close()
         print("Test 5: Client cleanup...")
         print("  ✅ Client closed successfully")
     except Exception as e:
         print(f"  ⚠️  Cleanup warning: {e}")
-    
+
     print()
     print("=" * 60)
     print("✅ Health check completed!")
@@ -120,12 +138,13 @@ def test_health(server_url: str, api_key: str | None = None):
         print("     Set NEXUS_API_KEY env var or use --api-key flag")
     else:
         print("  ✅ Authentication configured")
+    sys.stdout.flush()
     return True
 
 
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Test Nexus server health")
     parser.add_argument(
         "--server",
@@ -136,12 +155,16 @@ if __name__ == "__main__":
         "--api-key",
         help="API key for authentication (or set NEXUS_API_KEY env var)"
     )
-    
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Stream output live instead of buffering"
+    )
+
     args = parser.parse_args()
-    
+
     # Get API key from args or environment
     api_key = args.api_key or os.getenv("NEXUS_API_KEY")
-    
-    success = test_health(args.server, api_key)
-    sys.exit(0 if success else 1)
 
+    success = asyncio.run(test_health(args.server, api_key, verbose=args.verbose))
+    sys.exit(0 if success else 1)
@@ -1,61 +1,95 @@
 #!/usr/bin/env python3
 """Test which RPC methods are available on the Nexus server."""
 
+import asyncio
 import sys
 import os
+from operator import attrgetter, methodcaller
 
-# Add src to path for local testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
+# Shared bootstrap puts src/ on sys.path once for all test scripts
+from tests._bootstrap import nexus_client  # noqa: F401
 from nexus_client import RemoteNexusFS
 
-def test_method_availability(server_url: str, api_key: str):
-    """Test which RPC methods are available on the server."""
+# Test file path
+TEST_FILE = "/workspace/nexus-client-test/test_read_write.txt"
+
+# Probe descriptors, built once on first use (None sentinel). Each entry is
+# (method_name, target_getter, caller, description): the caller is applied to
+# the client (or to the attribute the getter selects). methodcaller and
+# attrgetter are C-level callables, so repeated suite runs skip the closure
+# cells and per-call frames that per-run lambdas would rebuild.
+_PROBES = None
+
+
+def _get_probes():
+    """Return the probe descriptors, building them on first call."""
+    global _PROBES
+    if _PROBES is None:
+        _memory = attrgetter("memory")
+        _PROBES = [
+            # File metadata methods
+            ("stat", None, methodcaller("stat", TEST_FILE), "Get file metadata (size, etag, etc.)"),
+            ("get_metadata", None, methodcaller("get_metadata", TEST_FILE), "Get file metadata (permissions, ownership)"),
+            ("get_etag", None, methodcaller("get_etag", TEST_FILE), "Get file ETag (content hash)"),
+
+            # Memory methods
+            ("memory.list", _memory, methodcaller("list", limit=1), "List memories"),
+            ("memory.query", _memory, methodcaller("query", limit=1), "Query memories"),
+            ("memory.search", _memory, methodcaller("search", "test", limit=1), "Search memories"),
+
+            # Direct RPC calls to check method names
+            ("list_memories (direct)", None, methodcaller("_call_rpc", "list_memories", {"limit": 1}), "Direct list_memories RPC"),
+            ("query_memories (direct)", None, methodcaller("_call_rpc", "query_memories", {"limit": 1}), "Direct query_memories RPC"),
+        ]
+    return _PROBES
+
+
+async def test_method_availability(server_url: str, api_key: str, verbose: bool = False):
+    """Test which RPC methods are available on the server.
+
+    The probes are independent and purely I/O-bound, so they are dispatched
+    concurrently via asyncio.gather - total wall time is roughly one server
+    round trip instead of the sum of all round trips.
+    """
+    # Block-buffer stdout; --verbose keeps live streaming
+    if not verbose:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("=" * 70)
     print("Nexus Server RPC Method Availability Test")
     print("=" * 70)
     print(f"Server: {server_url}")
     print()
-    
+
     nx = RemoteNexusFS(server_url, api_key=api_key, timeout=10)
-    
-    # Test file path
-    test_file = "/workspace/nexus-client-test/test_read_write.txt"
-    
-    # Methods to test
-    methods_to_test = [
-        # File metadata methods
-        ("stat", lambda: nx.stat(test_file), "Get file metadata (size, etag, etc.)"),
-        ("get_metadata", lambda: nx.get_metadata(test_file), "Get file metadata (permissions, ownership)"),
-        ("get_etag", lambda: nx.get_etag(test_file), "Get file ETag (content hash)"),
-        
-        # Memory methods
-        ("memory.list", lambda: nx.memory.list(limit=1), "List memories"),
-        ("memory.query", lambda: nx.memory.query(limit=1), "Query memories"),
-        ("memory.search", lambda: nx.memory.search("test", limit=1), "Search memories"),
-        
-        # Direct RPC calls to check method names
-        ("list_memories (direct)", lambda: nx._call_rpc("list_memories", {"limit": 1}), "Direct list_memories RPC"),
-        ("query_memories (direct)", lambda: nx._call_rpc("query_memories", {"limit": 1}), "Direct query_memories RPC"),
-    ]
-    
+
+    probes = _get_probes()
+
+    # Fire all probes concurrently; the blocking client calls run in threads
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.to_thread(caller, nx if getter is None else getter(nx))
+            for _, getter, caller, _ in probes
+        ),
+        return_exceptions=True,
+    )
+
     results = []
-    
-    for method_name, test_func, description in methods_to_test:
+
+    for (method_name, _, _, description), outcome in zip(probes, outcomes):
         print(f"Testing: {method_name}")
         print(f"  Description: {description}")
-        try:
-            result = test_func()
+        if not isinstance(outcome, BaseException):
             print(f"  ✅ Available")
-            if isinstance(result, dict):
-                print(f"     Result keys: {list(result.keys())[:5]}")
-            elif isinstance(result, list):
-                print(f"     Result type: list with {len(result)} items")
+            if isinstance(outcome, dict):
+                print(f"     Result keys: {list(outcome.keys())[:5]}")
+            elif isinstance(outcome, list):
+                print(f"     Result type: list with {len(outcome)} items")
             else:
-                print(f"     Result type: {type(result).__name__}")
+                print(f"     Result type: {type(outcome).__name__}")
             results.append((method_name, True, None))
-        except Exception as e:
-            error_msg = str(e)
+        else:
+            error_msg = str(outcome)
             if "Unknown method" in error_msg:
                 print(f"  ❌ Not available: Method not found on server")
                 results.append((method_name, False, "Method not found"))
@@ -66,45 +100,46 @@ def test_method_availability(server_url: str, api_key: str):
                 print(f"  ⚠️  Error: {error_msg[:100]}")
                 results.append((method_name, False, error_msg[:100]))
         print()
-    
+
     # Summary
     print("=" * 70)
     print("Summary")
     print("=" * 70)
     available = [r for r in results if r[1]]
     unavailable = [r for r in results if not r[1]]
-    
+
     print(f"\n✅ Available methods ({len(available)}):")
     for name, _, _ in available:
         print(f"   - {name}")
-    
+
     print(f"\n❌ Unavailable methods ({len(unavailable)}):")
     for name, _, reason in unavailable:
         print(f"   - {name}: {reason}")
-    
+
     print()
-    
+
     # Recommendations
     print("=" * 70)
     print("Recommendations")
     print("=" * 70)
-    
+
     if any("stat" in r[0] and not r[1] for r in results):
         print("\n📝 stat() method not available:")
         print("   Alternative: Use get_metadata() or get_etag() if available")
         print("   Workaround: Read file and check size, or use list() with details=True")
-    
+
     if any("query_memories" in r[0] and not r[1] for r in results):
         print("\n📝 query_memories() method not available:")
         print("   Alternative: Try memory.list() or list_memories() if available")
         print("   Note: Different server versions may use different method names")
-    
+
     nx.close()
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Test Nexus server RPC method availability")
     parser.add_argument(
         "--server",
@@ -115,13 +150,17 @@ if __name__ == "__main__":
         "--api-key",
         help="API key for authentication (or set NEXUS_API_KEY env var)"
     )
-    
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Stream output live instead of buffering"
+    )
+
     args = parser.parse_args()
-    
+
     api_key = args.api_key or os.getenv("NEXUS_API_KEY")
     if not api_key:
         print("Error: API key required")
         sys.exit(1)
-    
-    test_method_availability(args.server, api_key)
 
+    asyncio.run(test_method_availability(args.server, api_key, verbose=args.verbose))
@@ -0,0 +1,19 @@
+"""Shared sys.path bootstrap for the top-level test scripts.
+
+Each script used to insert ``src/`` onto sys.path itself before importing
+nexus_client. Doing it once here means the insertion (and the package
+import) happens a single time no matter how many scripts are loaded into
+one process.
+"""
+
+import os
+import sys
+
+# Make src/ importable when the package isn't pip-installed
+_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+import nexus_client  # noqa: E402
+
+__all__ = ["nexus_client"]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import gzip
+import json
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 import httpx
@@ -29,7 +32,7 @@ def mock_httpx_client():
 
 
 @pytest.fixture
-def remote_client(mock_httpx_client):
+def remote_client(mock_httpx_client, tmp_path):
     """Create a RemoteNexusFS instance with mocked httpx client."""
     with patch("nexus_client.client.httpx.Client", return_value=mock_httpx_client):
         client = RemoteNexusFS(
@@ -40,6 +43,9 @@ def remote_client(mock_httpx_client):
             max_retries=1,  # Reduce retries for faster tests
         )
         client.session = mock_httpx_client
+        # Keep the response cache out of the developer's real ~/.cache
+        client._cache_path = tmp_path / "rpc_cache.json"
+        client._response_cache = {}
         # Mock auth info fetch to avoid actual HTTP call
         mock_response = Mock()
         mock_response.status_code = 200
@@ -192,6 +198,71 @@ class TestRemoteNexusFSRPCCalls:
         assert exception.method == "read"
 
 
+class TestRemoteNexusFSBatch:
+    """Test batched RPC execution."""
+
+    @staticmethod
+    def _rpc_response(result=None, error=None):
+        """Build a mock HTTP response wrapping an RPC result or error."""
+        response_data = {"jsonrpc": "2.0", "id": "123"}
+        if error is not None:
+            response_data["error"] = error
+        else:
+            response_data["result"] = result
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = encode_rpc_message(response_data)
+        return mock_response
+
+    def test_batch_single_round_trip(self, remote_client, mock_httpx_client):
+        """Test batch uses one RPC call when the server supports it."""
+        mock_httpx_client.post.return_value = self._rpc_response(
+            result={
+                "results": [
+                    {"status": "ok", "result": {"etag": "abc123"}},
+                    {"status": "ok", "result": {"exists": True}},
+                ]
+            }
+        )
+
+        results = remote_client.batch([
+            ("write", {"path": "/a.txt", "content": b"hi"}),
+            ("exists", {"path": "/a.txt"}),
+        ])
+        assert len(results) == 2
+        assert results[0]["result"]["etag"] == "abc123"
+        assert results[1]["result"]["exists"] is True
+        assert mock_httpx_client.post.call_count == 1
+
+    def test_batch_falls_back_when_server_lacks_method(self, remote_client, mock_httpx_client):
+        """Test batch executes calls sequentially on older servers."""
+        mock_httpx_client.post.side_effect = [
+            self._rpc_response(
+                error={
+                    # Detection keys off the code, not the server's wording
+                    "code": RPCErrorCode.METHOD_NOT_FOUND.value,
+                    "message": "no handler registered for 'batch'",
+                }
+            ),
+            self._rpc_response(result={"exists": True}),
+            self._rpc_response(
+                error={
+                    "code": RPCErrorCode.FILE_NOT_FOUND.value,
+                    "message": "File not found",
+                    "data": {"path": "/missing.txt"},
+                }
+            ),
+        ]
+
+        results = remote_client.batch([
+            ("exists", {"path": "/a.txt"}),
+            ("stat", {"path": "/missing.txt"}),
+        ])
+        assert results[0] == {"status": "ok", "result": {"exists": True}}
+        assert results[1]["status"] == "error"
+        assert "/missing.txt" in results[1]["error"]
+
+
 class TestRemoteNexusFSFileOperations:
     """Test file operations."""
 
@@ -267,6 +338,45 @@ class TestRemoteNexusFSFileOperations:
         files = remote_client.list("/")
         assert files == ["/file1.txt", "/file2.txt"]
 
+    def test_ensure_dir(self, remote_client, mock_httpx_client):
+        """Test conditional directory creation in one call."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        response_data = {
+            "jsonrpc": "2.0",
+            "id": "123",
+            "result": {"created": True, "existed": False},
+        }
+        mock_response.content = encode_rpc_message(response_data)
+        mock_httpx_client.post.return_value = mock_response
+
+        info = remote_client.ensure_dir("/workspace/new-dir")
+        assert info == {"created": True, "existed": False}
+        assert mock_httpx_client.post.call_count == 1
+
+    def test_ensure_dir_falls_back_when_server_lacks_method(self, remote_client, mock_httpx_client):
+        """Test ensure_dir degrades to exists + mkdir on older servers."""
+
+        def _response(result=None, error=None):
+            data = {"jsonrpc": "2.0", "id": "123"}
+            if error is not None:
+                data["error"] = error
+            else:
+                data["result"] = result
+            mock = Mock()
+            mock.status_code = 200
+            mock.content = encode_rpc_message(data)
+            return mock
+
+        mock_httpx_client.post.side_effect = [
+            _response(error={"code": RPCErrorCode.METHOD_NOT_FOUND.value, "message": "Unknown method: ensure_directory"}),
+            _response(result={"exists": False}),
+            _response(result=None),
+        ]
+
+        info = remote_client.ensure_dir("/workspace/new-dir")
+        assert info == {"created": True, "existed": False}
+
     def test_glob_files(self, remote_client, mock_httpx_client):
         """Test glob pattern search."""
         mock_response = Mock()
@@ -302,6 +412,162 @@ class TestRemoteNexusFSFileOperations:
         assert len(results) == 1
         assert results[0]["file"] == "/test.py"
 
+    def test_grep_invalid_pattern_fails_locally(self, remote_client, mock_httpx_client):
+        """Test an invalid regex is rejected before any round trip."""
+        with pytest.raises(ValidationError):
+            remote_client.grep("[unclosed", "/")
+        mock_httpx_client.post.assert_not_called()
+
+
+class TestDeferredDeletes:
+    """Test delete_async() queueing and bulk flush."""
+
+    def test_delete_async_queues_without_rpc(self, remote_client, mock_httpx_client):
+        """Test queued deletes don't hit the network until flushed."""
+        remote_client.delete_async("/a.txt")
+        remote_client.delete_async("/b.txt")
+        mock_httpx_client.post.assert_not_called()
+        assert remote_client._pending_deletes == ["/a.txt", "/b.txt"]
+
+    def test_flush_deletes_uses_one_bulk_call(self, remote_client, mock_httpx_client):
+        """Test flush sends all queued paths as a single delete_bulk RPC."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        response_data = {
+            "jsonrpc": "2.0",
+            "id": "123",
+            "result": {"/a.txt": {"success": True}, "/b.txt": {"success": True}},
+        }
+        mock_response.content = encode_rpc_message(response_data)
+        mock_httpx_client.post.return_value = mock_response
+
+        remote_client.delete_async("/a.txt")
+        remote_client.delete_async("/b.txt")
+        results = remote_client.flush_deletes()
+        assert results["/a.txt"]["success"] is True
+        assert mock_httpx_client.post.call_count == 1
+        assert remote_client._pending_deletes == []
+        # Nothing queued: no extra round trip
+        assert remote_client.flush_deletes() == {}
+        assert mock_httpx_client.post.call_count == 1
+
+    def test_close_flushes_pending_deletes(self, remote_client, mock_httpx_client):
+        """Test close() flushes the queue before shutting down."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        response_data = {"jsonrpc": "2.0", "id": "123", "result": {"/a.txt": {"success": True}}}
+        mock_response.content = encode_rpc_message(response_data)
+        mock_httpx_client.post.return_value = mock_response
+
+        remote_client.delete_async("/a.txt")
+        remote_client.close()
+        assert mock_httpx_client.post.call_count == 1
+        assert remote_client._pending_deletes == []
+
+
+class TestResponseCache:
+    """Test the ETag-validated response cache for read-only methods."""
+
+    @staticmethod
+    def _rpc_response(result, etag=None, status_code=200):
+        """Build a mock HTTP response with optional ETag header."""
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = {"etag": etag} if etag else {}
+        mock_response.content = encode_rpc_message({"jsonrpc": "2.0", "id": "123", "result": result})
+        return mock_response
+
+    def test_fresh_entry_served_without_rpc(self, remote_client, mock_httpx_client):
+        """Test a just-cached response is reused without a round trip."""
+        remote_client._response_cache.clear()
+        mock_httpx_client.post.return_value = self._rpc_response({"skills": [], "count": 0}, etag='"v1"')
+
+        first = remote_client.skills_list()
+        second = remote_client.skills_list()
+        assert first == second == {"skills": [], "count": 0}
+        # Second call hit the expiration floor, not the network
+        assert mock_httpx_client.post.call_count == 1
+
+    def test_stale_entry_revalidated_with_304(self, remote_client, mock_httpx_client):
+        """Test a stale entry is revalidated via If-None-Match and a 304."""
+        remote_client._response_cache.clear()
+        mock_httpx_client.post.return_value = self._rpc_response({"skills": [{"name": "s1"}]}, etag='"v1"')
+        remote_client.skills_list()
+
+        # Age the entry past the expiration floor, then answer with 304
+        key, (etag, result, fetched_at) = next(iter(remote_client._response_cache.items()))
+        remote_client._response_cache[key] = (etag, result, fetched_at - 60)
+        mock_httpx_client.post.return_value = Mock(status_code=304)
+
+        assert remote_client.skills_list() == {"skills": [{"name": "s1"}]}
+        sent_headers = mock_httpx_client.post.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+
+    def test_mutating_methods_not_cached(self, remote_client, mock_httpx_client):
+        """Test write responses never enter the cache."""
+        remote_client._response_cache.clear()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"etag": '"v1"'}
+        mock_response.content = encode_rpc_message({"jsonrpc": "2.0", "id": "123", "result": {"etag": "abc"}})
+        mock_httpx_client.post.return_value = mock_response
+
+        remote_client.write("/test.txt", b"data")
+        assert remote_client._response_cache == {}
+
+    def test_cache_hit_returns_a_copy(self, remote_client, mock_httpx_client):
+        """Test mutating a cache-served result doesn't poison later hits."""
+        remote_client._response_cache.clear()
+        mock_httpx_client.post.return_value = self._rpc_response({"skills": [{"name": "s1"}]}, etag='"v1"')
+
+        first = remote_client.skills_list()
+        first["skills"].clear()
+        assert remote_client.skills_list() == {"skills": [{"name": "s1"}]}
+
+    def test_persisted_results_keep_rich_types(self, remote_client):
+        """Test datetime values in cached results survive a save/load round trip."""
+        key = remote_client._cache_key("skills_info", {"skill_id": "s1"})
+        created = datetime(2026, 1, 1, 12, 0)
+        remote_client._response_cache = {key: ('"v1"', {"name": "s1", "created_at": created}, 0.0)}
+        remote_client._save_response_cache()
+
+        remote_client._response_cache = {}
+        remote_client._load_response_cache()
+        assert remote_client._response_cache[key][1]["created_at"] == created
+
+    def test_cache_key_scoped_by_server_and_tenant(self, remote_client):
+        """Test cache keys embed the server URL and tenant/agent scope."""
+        key = remote_client._cache_key("skills_list", None)
+        assert key.startswith("http://localhost:8080|test-tenant|")
+        remote_client._tenant_id = "other-tenant"
+        assert remote_client._cache_key("skills_list", None) != key
+
+    def test_save_merges_with_existing_file(self, remote_client, tmp_path):
+        """Test saving does not discard another instance's entries."""
+        cache_path = tmp_path / "rpc_cache.json"
+        cache_path.write_text(json.dumps({"other-scope|skills_list:null": ["\"v9\"", {"skills": []}, 0.0]}))
+        remote_client._cache_path = cache_path
+        remote_client._response_cache = {remote_client._cache_key("skills_list", None): ('"v1"', {"skills": []}, 0.0)}
+        remote_client._save_response_cache()
+
+        on_disk = json.loads(cache_path.read_text())
+        assert len(on_disk) == 2
+
+    def test_cache_persists_across_clients(self, remote_client, mock_httpx_client, tmp_path):
+        """Test the cache survives a save/load round trip."""
+        remote_client._response_cache.clear()
+        remote_client._cache_path = tmp_path / "rpc_cache.json"
+        mock_httpx_client.post.return_value = self._rpc_response({"skills": []}, etag='"v1"')
+        remote_client.skills_list()
+        remote_client._save_response_cache()
+
+        reloaded = RemoteNexusFS("http://localhost:8080", cache_enabled=False)
+        reloaded._cache_enabled = True
+        reloaded._cache_path = tmp_path / "rpc_cache.json"
+        reloaded._load_response_cache()
+        assert len(reloaded._response_cache) == 1
+        reloaded.close()
+
 
 class TestRemoteMemory:
     """Test RemoteMemory API."""
@@ -353,6 +619,46 @@ class TestRemoteMemory:
         assert remote_client.memory is memory
 
 
+class TestRequestCompression:
+    """Test opt-in gzip compression of large request bodies."""
+
+    @staticmethod
+    def _ok_response():
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = encode_rpc_message({"jsonrpc": "2.0", "id": "123", "result": {"etag": "abc"}})
+        return mock_response
+
+    def test_large_body_gzipped(self, remote_client, mock_httpx_client):
+        """Test bodies over the threshold are gzipped with Content-Encoding."""
+        remote_client.compress_requests = True
+        mock_httpx_client.post.return_value = self._ok_response()
+
+        remote_client.write("/big.txt", b"x" * 4096)
+        kwargs = mock_httpx_client.post.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        decoded = json.loads(gzip.decompress(kwargs["content"]))
+        assert decoded["method"] == "write"
+
+    def test_small_body_not_compressed(self, remote_client, mock_httpx_client):
+        """Test small bodies go uncompressed even when opted in."""
+        remote_client.compress_requests = True
+        mock_httpx_client.post.return_value = self._ok_response()
+
+        remote_client.delete("/a.txt")
+        kwargs = mock_httpx_client.post.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["content"])["method"] == "delete"
+
+    def test_compression_off_by_default(self, remote_client, mock_httpx_client):
+        """Test compression stays off unless requested."""
+        mock_httpx_client.post.return_value = self._ok_response()
+
+        remote_client.write("/big.txt", b"x" * 4096)
+        kwargs = mock_httpx_client.post.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+
+
 class TestErrorHandling:
     """Test error handling."""
 